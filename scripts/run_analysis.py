@@ -1,8 +1,25 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 from src.analysis.dna_analyzer import DNAAnalyzer
 from src.analysis.sequence_clustering import cluster_sequences
-from src.visualization.plots import plot_gc_content, plot_sequence_clusters, plot_kmer_frequency
+from src.visualization.plots import plot_gc_content, plot_sequence_clusters, plot_kmer_frequency_batch, close
 from src.utils.logger import setup_logging, log_message
 
+# Analyzer shared with each worker process once, so tasks only carry sequence IDs.
+_worker_analyzer = None
+
+
+def _init_worker(analyzer):
+    """Store the analyzer in the worker process."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analysis_worker(args):
+    """Run GC, motif and k-mer analysis of one sequence inside a worker process."""
+    seq_id, motifs, k = args
+    return _worker_analyzer.analyze_sequence(_worker_analyzer.sequences[seq_id], motifs, k)
+
 
 def main():
     setup_logging()
@@ -10,26 +27,31 @@ def main():
 
     # Initialize DNAAnalyzer
     analyzer = DNAAnalyzer("data/sequences.fasta")
+    seq_ids = list(analyzer.sequences)
+    max_workers = os.cpu_count() or 1
+    chunksize = max(1, len(seq_ids) // (max_workers * 4))
+
+    # Analyze GC content, motifs and k-mer frequency in one pass per sequence
+    motifs = ["ATAGC"]
+    gc_contents = []
+    all_kmer_freqs = {}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(analyzer,)) as executor:
+        tasks = ((seq_id, motifs, 3) for seq_id in seq_ids)
+        results = executor.map(_analysis_worker, tasks, chunksize=chunksize)
+        for seq_id, (gc_content, motif_positions, kmer_freq) in zip(seq_ids, results):
+            gc_contents.append(gc_content)
+            for motif, positions in motif_positions.items():
+                log_message("Motif %s found in %s at positions: %s", motif, seq_id, positions)
+            all_kmer_freqs[seq_id] = kmer_freq
+            log_message("Analyzed k-mer frequency for %s", seq_id)
 
-    # Analyze GC content
-    gc_contents = [analyzer.get_gc_content(seq) for seq in analyzer.sequences.values()]
     plot_gc_content(analyzer.sequences, gc_contents)
-
-    # Find motifs
-    motif = "ATAGC"
-    for seq_id, sequence in analyzer.sequences.items():
-        motif_positions = analyzer.find_motifs(sequence, motif)
-        log_message(f"Motif {motif} found in {seq_id} at positions: {motif_positions}")
-
-    # Analyze k-mer frequency
-    for seq_id, sequence in analyzer.sequences.items():
-        kmer_freq = analyzer.get_kmer_frequency(sequence)
-        log_message(f"Analyzed k-mer frequency for {seq_id}")
-        plot_kmer_frequency(kmer_freq)
+    plot_kmer_frequency_batch(all_kmer_freqs)
 
     # Cluster sequences
     clusters, features = cluster_sequences(analyzer.sequences)
     plot_sequence_clusters(features, list(clusters.values()))
+    close()
 
     log_message("Genetic analysis completed")
 
@@ -25,12 +25,17 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[
-        "biopython==1.79",
         "matplotlib==3.4.3",
         "numpy==1.21.2",
         "scikit-learn==0.24.2",
-        "seaborn==0.11.2",
     ],
+    extras_require={
+        "fast": [
+            "numba==0.55.1",
+            "pyahocorasick==1.4.2",
+            "pyfastx==0.8.4",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "genomic_insights=scripts.run_analysis:main",
@@ -3,6 +3,7 @@ This module contains the core analysis functionality for the project.
 """
 
 from .dna_analyzer import DNAAnalyzer
+from .sequence_buffer import SequenceView
 from .sequence_clustering import cluster_sequences
 
-__all__ = ['DNAAnalyzer', 'cluster_sequences']
+__all__ = ['DNAAnalyzer', 'SequenceView', 'cluster_sequences']
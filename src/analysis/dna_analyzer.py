@@ -1,47 +1,208 @@
-import re
+import gzip
+import json
+import mmap
+import os
 from collections import Counter
-from Bio import SeqIO
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.analysis.kmer_counts import MAX_PACKED_K, encode_bases, count_kmer_ids, count_long_kmers, kmer_counter
+from src.analysis.sequence_buffer import SequenceView, drop_duplicate_ids, get_gc_count, get_gc_contents
 from src.utils.logger import log_message
 
+try:
+    import ahocorasick
+except ImportError:  # optional dependency, see the "fast" extra in setup.py
+    ahocorasick = None
+
+try:
+    import pyfastx
+except ImportError:  # optional dependency, see the "fast" extra in setup.py
+    pyfastx = None
+
+# Suffix of the parsed-FASTA cache written next to the input file.
+_CACHE_SUFFIX = '.gi.npz'
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
 
 class DNAAnalyzer:
-    def __init__(self, file_path):
+    def __init__(self, file_path, use_cache=True):
         """
         Initialize the DNAAnalyzer with a FASTA file.
 
         Args:
             file_path (str): Path to the FASTA file.
+            use_cache (bool): Reuse (and write) a parsed copy of the file stored
+                next to it as ``<file_path>.gi.npz``.
         """
         self.file_path = file_path
-        self.sequences = self._read_fasta()
+        self.ids, self.seq_buf, self.offsets = self._load_sequences(use_cache)
+        self.sequences = SequenceView(self.ids, self.seq_buf, self.offsets)
+        self._motif_cache = {}
+        self._automata = {}
         log_message("DNAAnalyzer initialized with file: " + file_path)
 
+    def _load_sequences(self, use_cache):
+        """
+        Load the packed sequences from the cache if it is up to date, else parse the FASTA file.
+
+        The cache is only used if the size and modification time (in ns) of
+        the FASTA file stored in it match the file exactly, so a file replaced
+        by one with an older timestamp is parsed again.
+
+        Args:
+            use_cache (bool): Whether to read and write the cache.
+
+        Returns:
+            tuple: Sequence IDs, packed uint8 buffer and int64 offsets.
+        """
+        if not use_cache:
+            return self._read_fasta()
+
+        cache_path = self.file_path + _CACHE_SUFFIX
+        source_stat = os.stat(self.file_path)
+        source_key = np.array([source_stat.st_size, source_stat.st_mtime_ns], dtype=np.int64)
+        if os.path.exists(cache_path):
+            try:
+                with np.load(cache_path) as data:
+                    if np.array_equal(data['source'], source_key):
+                        ids = json.loads(data['ids'].tobytes())
+                        seq_buf, offsets = data['seq_buf'], data['offsets']
+                        log_message(f"Loaded {len(ids)} sequences from cache: {cache_path}")
+                        return ids, seq_buf, offsets
+            except (OSError, ValueError, KeyError) as e:
+                log_message(f"Ignoring unreadable cache {cache_path}: {e}")
+
+        ids, seq_buf, offsets = self._read_fasta()
+        self._write_cache(cache_path, source_key, ids, seq_buf, offsets)
+        return ids, seq_buf, offsets
+
+    def _write_cache(self, cache_path, source_key, ids, seq_buf, offsets):
+        """
+        Save the packed sequences next to the FASTA file; failures only skip caching.
+
+        Args:
+            cache_path (str): Path of the cache file.
+            source_key (np.array): Size and mtime in ns of the FASTA file that was parsed.
+            ids (list): Sequence IDs in file order.
+            seq_buf (np.array): Concatenated bases as uint8.
+            offsets (np.array): int64 start offsets, with the total length appended.
+        """
+        tmp_path = cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as fh:
+                np.savez(fh, source=source_key, seq_buf=seq_buf, offsets=offsets,
+                         ids=np.frombuffer(json.dumps(ids).encode(), dtype=np.uint8))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            log_message(f"Could not write cache {cache_path}: {e}")
+
     def _read_fasta(self):
         """
-        Read the FASTA file and return a dictionary of sequences.
+        Read the FASTA file into a packed structure-of-arrays layout.
+
+        As with a dict of records, a repeated ID keeps its first position and
+        the sequence of its last record.
+
+        Parsing is done in C by pyfastx when it is installed, otherwise (or if
+        pyfastx rejects the file) by a memory-mapped reader. Both accept
+        gzipped files.
+
+        Returns:
+            list: Sequence IDs in file order.
+            np.array: All bases concatenated into one uint8 buffer.
+            np.array: int64 start offset of each sequence, with the total length appended.
+        """
+        if pyfastx is None:
+            ids, lengths, seq_buf = self._parse_fasta_mmap()
+        else:
+            try:
+                ids, lengths, seq_buf = self._parse_fasta_pyfastx()
+            except RuntimeError as e:
+                # pyfastx rejects empty files and text before the first header.
+                log_message(f"pyfastx could not parse {self.file_path} ({e}), using the mmap reader")
+                ids, lengths, seq_buf = self._parse_fasta_mmap()
+
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        n_records = len(ids)
+        ids, seq_buf, offsets = drop_duplicate_ids(ids, np.frombuffer(seq_buf, dtype=np.uint8), offsets)
+        if len(ids) != n_records:
+            log_message(f"Kept the last of each duplicate ID: {n_records - len(ids)} records replaced")
+        log_message(f"Read {len(ids)} sequences from FASTA file")
+        return ids, seq_buf, offsets
+
+    def _parse_fasta_pyfastx(self):
+        """
+        Parse the FASTA file with pyfastx, without building its on-disk index.
+
+        Returns:
+            list: Sequence IDs in file order.
+            list: Length of each sequence.
+            bytearray: All bases concatenated.
+        """
+        ids = []
+        lengths = []
+        seq_buf = bytearray()
+        for seq_id, sequence in pyfastx.Fasta(self.file_path, build_index=False):
+            ids.append(seq_id)
+            lengths.append(len(sequence))
+            seq_buf += sequence.encode('ascii')
+        return ids, lengths, seq_buf
+
+    def _parse_fasta_mmap(self):
+        """
+        Parse the FASTA file by memory-mapping it and locating records with find.
+
+        Gzipped files (detected by their magic bytes) are decompressed into
+        memory instead, since they cannot be mapped.
 
         Returns:
-            dict: A dictionary with sequence IDs as keys and sequences as values.
+            list: Sequence IDs in file order.
+            list: Length of each sequence.
+            bytearray: All bases concatenated.
         """
-        sequences = {record.id: str(record.seq) for record in SeqIO.parse(self.file_path, "fasta")}
-        log_message(f"Read {len(sequences)} sequences from FASTA file")
-        return sequences
+        with open(self.file_path, 'rb') as fasta:
+            is_gzipped = fasta.read(2) == _GZIP_MAGIC
+            fasta.seek(0)
+            if is_gzipped:
+                with gzip.open(fasta) as gz:
+                    return _parse_fasta_records(gz.read())
+            if os.fstat(fasta.fileno()).st_size == 0:
+                return [], [], bytearray()
+            with mmap.mmap(fasta.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _parse_fasta_records(data)
 
     def get_gc_content(self, sequence):
         """
         Calculate the GC content of a given sequence.
 
         Args:
-            sequence (str): DNA sequence.
+            sequence (str or bytes): DNA sequence.
 
         Returns:
             float: GC content percentage.
+
+        Raises:
+            ValueError: If the sequence is empty.
         """
-        gc_count = sequence.count('G') + sequence.count('C')
-        gc_content = gc_count / len(sequence) * 100
-        log_message(f"Calculated GC content: {gc_content:.2f}%")
+        if not sequence:
+            raise ValueError("Cannot calculate the GC content of an empty sequence")
+        gc_content = get_gc_count(sequence) / len(sequence) * 100
+        log_message("Calculated GC content: %.2f%%", gc_content)
         return gc_content
 
+    def get_gc_contents(self):
+        """
+        Calculate the GC content of every sequence in the file in one pass over the packed buffer.
+
+        Returns:
+            np.array: GC content percentage of each sequence, in file order.
+        """
+        gc_contents = get_gc_contents(self.seq_buf, self.offsets)
+        log_message(f"Calculated GC content of {len(gc_contents)} sequences")
+        return gc_contents
+
     def find_motifs(self, sequence, motif):
         """
         Find all occurrences of a motif in a sequence.
@@ -53,14 +214,165 @@ class DNAAnalyzer:
         Returns:
             list: List of starting positions of the motif.
         """
-        positions = [m.start() for m in re.finditer(f'(?={motif})', sequence)]
-        log_message(f"Found {len(positions)} occurrences of motif '{motif}'")
+        positions = self._find_motif_positions(sequence, motif)
+        log_message("Found %d occurrences of motif '%s'", len(positions), motif)
+        return positions
+
+    def find_motifs_batch(self, sequence, motifs):
+        """
+        Find all occurrences of several motifs in a sequence in a single pass.
+
+        When pyahocorasick is installed, one Aho-Corasick automaton is built per
+        motif set (and reused across calls), so the sequence is scanned once
+        regardless of how many motifs are searched for.
+
+        Args:
+            sequence (str or bytes): DNA sequence.
+            motifs (list): Motifs to search for.
+
+        Returns:
+            dict: A dictionary with motifs as keys and lists of starting positions as values.
+        """
+        positions = {motif: [] for motif in motifs}
+        # The empty motif matches everywhere, as with find_motifs; the automaton cannot hold it.
+        automaton_motifs = tuple(motif for motif in positions if motif)
+        if ahocorasick is None or not automaton_motifs:
+            for motif in positions:
+                positions[motif] = self._find_motif_positions(sequence, motif)
+        else:
+            if '' in positions:
+                positions[''] = self._find_motif_positions(sequence, '')
+            if isinstance(sequence, bytes):
+                sequence = sequence.decode('ascii')
+            automaton = self._get_automaton(automaton_motifs)
+            for end, motif in automaton.iter(sequence):
+                positions[motif].append(end - len(motif) + 1)
+
+        for motif, motif_positions in positions.items():
+            log_message("Found %d occurrences of motif '%s'", len(motif_positions), motif)
         return positions
 
+    def find_motifs_parallel(self, sequence, motif, chunk_size=1 << 16, workers=None):
+        """
+        Find all occurrences of a motif in a very long sequence using a thread pool.
+
+        The sequence is split into chunks that overlap by ``len(motif) - 1``
+        bases, so a match spanning a boundary is found in exactly one chunk.
+        Chunks are scanned with NumPy comparisons, which release the GIL.
+
+        Args:
+            sequence (str or bytes): DNA sequence.
+            motif (str): Motif to search for.
+            chunk_size (int): Number of candidate start positions per chunk.
+            workers (int): Number of threads; defaults to ThreadPoolExecutor's default.
+
+        Returns:
+            list: List of starting positions of the motif.
+        """
+        if not motif:
+            return self.find_motifs(sequence, motif)
+
+        seq_bytes = sequence.encode('ascii') if isinstance(sequence, str) else sequence
+        seq_buf = np.frombuffer(seq_bytes, dtype=np.uint8)
+        motif_buf = np.frombuffer(motif.encode('ascii'), dtype=np.uint8)
+        overlap = motif_buf.size - 1
+        chunk_starts = range(0, seq_buf.size, chunk_size)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunk_positions = executor.map(
+                lambda start: _find_motif_in_chunk(seq_buf[start:start + chunk_size + overlap], motif_buf) + start,
+                chunk_starts)
+            positions = [int(p) for chunk in chunk_positions for p in chunk]
+
+        log_message("Found %d occurrences of motif '%s'", len(positions), motif)
+        return positions
+
+    def _find_motif_positions(self, sequence, motif):
+        """
+        Find all (possibly overlapping) occurrences of a motif with bytes.find.
+
+        Args:
+            sequence (str or bytes): DNA sequence.
+            motif (str): Motif to search for.
+
+        Returns:
+            list: List of starting positions of the motif.
+        """
+        seq_bytes = sequence.encode('ascii') if isinstance(sequence, str) else sequence
+        motif_bytes = self._motif_cache.get(motif)
+        if motif_bytes is None:
+            motif_bytes = self._motif_cache[motif] = motif.encode('ascii')
+
+        positions = []
+        i = seq_bytes.find(motif_bytes)
+        while i != -1:
+            positions.append(i)
+            i = seq_bytes.find(motif_bytes, i + 1)
+        return positions
+
+    def _get_automaton(self, motifs):
+        """
+        Return the Aho-Corasick automaton for a motif set, building it on first use.
+
+        Args:
+            motifs (tuple): Motifs to search for.
+
+        Returns:
+            ahocorasick.Automaton: Automaton with each motif as both key and value.
+        """
+        automaton = self._automata.get(motifs)
+        if automaton is None:
+            automaton = ahocorasick.Automaton()
+            for motif in motifs:
+                automaton.add_word(motif, motif)
+            automaton.make_automaton()
+            self._automata[motifs] = automaton
+        return automaton
+
+    def analyze_sequence(self, sequence, motifs, k=3):
+        """
+        Calculate GC content, motif positions and k-mer frequency of a sequence together.
+
+        The sequence is encoded once; GC content is taken from the same 2-bit
+        base codes that are used to pack the k-mers, instead of scanning the
+        sequence separately for each analysis.
+
+        Args:
+            sequence (str): DNA sequence.
+            motifs (list): Motifs to search for.
+            k (int): Length of k-mer.
+
+        Returns:
+            float: GC content percentage.
+            dict: A dictionary with motifs as keys and lists of starting positions as values.
+            Counter: A Counter object with k-mers and their frequencies.
+
+        Raises:
+            ValueError: If the sequence is empty.
+        """
+        if not sequence:
+            raise ValueError("Cannot calculate the GC content of an empty sequence")
+        codes = encode_bases(sequence)
+        gc_content = np.count_nonzero((codes == 1) | (codes == 2)) / len(sequence) * 100
+        motif_positions = self.find_motifs_batch(sequence, motifs)
+        if 0 < k <= MAX_PACKED_K:
+            kmer_freq = kmer_counter(*count_kmer_ids(codes, k), k)
+        else:
+            kmer_freq = self.get_kmer_frequency(sequence, k)
+        log_message("Analyzed sequence: GC content %.2f%%, %d distinct %d-mers", gc_content, len(kmer_freq), k)
+        return gc_content, motif_positions, kmer_freq
+
     def get_kmer_frequency(self, sequence, k=3):
         """
         Calculate the frequency of k-mers in a sequence.
 
+        For k up to 31, each k-mer is packed into a 2-bit-per-base int64 ID and
+        counted with np.unique (see src.analysis.kmer_counts), so no per-k-mer
+        strings are allocated; longer k-mers are counted as strings. Either
+        way, k-mers containing bases other than A/C/G/T are skipped and
+        lowercase bases are counted as uppercase. To count several k for the same sequence, use
+        get_kmer_frequencies, which encodes the sequence only once.
+
         Args:
             sequence (str): DNA sequence.
             k (int): Length of k-mer.
@@ -68,7 +380,78 @@ class DNAAnalyzer:
         Returns:
             Counter: A Counter object with k-mers and their frequencies.
         """
-        kmers = [sequence[i:i + k] for i in range(len(sequence) - k + 1)]
-        frequency = Counter(kmers)
-        log_message(f"Calculated frequency of {k}-mers")
-        return frequency
+        return self.get_kmer_frequencies(sequence, [k])[k]
+
+    def get_kmer_frequencies(self, sequence, ks):
+        """
+        Calculate the frequency of k-mers in a sequence for several k-mer lengths.
+
+        Args:
+            sequence (str): DNA sequence.
+            ks (list): k-mer lengths.
+
+        Returns:
+            dict: A dictionary with k as keys and k-mer frequency Counters as values.
+        """
+        codes = None
+        frequencies = {}
+        for k in ks:
+            if 0 < k <= MAX_PACKED_K:
+                if codes is None:
+                    codes = encode_bases(sequence)
+                frequencies[k] = kmer_counter(*count_kmer_ids(codes, k), k)
+            elif k > MAX_PACKED_K:
+                frequencies[k] = count_long_kmers(sequence, k)
+            else:
+                frequencies[k] = Counter(sequence[i:i + k] for i in range(len(sequence) - k + 1))
+            log_message("Calculated frequency of %d-mers", k)
+        return frequencies
+
+
+def _parse_fasta_records(data):
+    """
+    Split FASTA data into records using C-level find calls instead of a per-line loop.
+
+    Args:
+        data (bytes or mmap.mmap): Raw FASTA contents.
+
+    Returns:
+        list: Sequence IDs in file order.
+        list: Length of each sequence.
+        bytearray: All bases concatenated, with whitespace removed.
+    """
+    ids = []
+    lengths = []
+    seq_buf = bytearray()
+    # Anything before the first header is ignored.
+    if data[:1] == b'>':
+        pos = 0
+    else:
+        pos = data.find(b'\n>')
+        if pos != -1:
+            pos += 1
+    while pos != -1:
+        header_end = data.find(b'\n', pos)
+        if header_end == -1:
+            header_end = len(data)
+        next_record = data.find(b'\n>', header_end)
+        body_end = len(data) if next_record == -1 else next_record
+
+        header = data[pos + 1:header_end].split(None, 1)
+        ids.append(header[0].decode() if header else '')
+        body = data[header_end:body_end].translate(None, b' \t\r\n')
+        lengths.append(len(body))
+        seq_buf += body
+        pos = next_record + 1 if next_record != -1 else -1
+    return ids, lengths, seq_buf
+
+
+def _find_motif_in_chunk(chunk, motif_buf):
+    """Return the start positions of motif_buf within a uint8 chunk."""
+    n_starts = chunk.size - motif_buf.size + 1
+    if n_starts <= 0:
+        return np.empty(0, dtype=np.int64)
+    mask = chunk[:n_starts] == motif_buf[0]
+    for j in range(1, motif_buf.size):
+        mask &= chunk[j:j + n_starts] == motif_buf[j]
+    return np.flatnonzero(mask)
@@ -0,0 +1,156 @@
+from collections import Counter
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional dependency, see the "fast" extra in setup.py
+    njit = None
+
+# 2-bit codes for A/C/G/T (either case); any other byte is marked as ambiguous.
+AMBIGUOUS = 255
+_BASE_CODES = np.full(256, AMBIGUOUS, dtype=np.uint8)
+_BASE_CODES[list(b"ACGT")] = np.arange(4)
+_BASE_CODES[list(b"acgt")] = np.arange(4)
+
+# Largest k whose packed 2-bit k-mer IDs fit in an int64.
+MAX_PACKED_K = 31
+
+
+def encode_bases(sequence):
+    """
+    Encode a sequence as 2-bit base codes (A=0, C=1, G=2, T=3).
+
+    Args:
+        sequence (str or bytes): DNA sequence.
+
+    Returns:
+        np.array: uint8 base codes, with AMBIGUOUS for bases other than A/C/G/T.
+    """
+    seq_bytes = sequence.encode('ascii') if isinstance(sequence, str) else sequence
+    return _BASE_CODES[np.frombuffer(seq_bytes, dtype=np.uint8)]
+
+
+def count_kmer_ids(codes, k):
+    """
+    Count k-mers by their packed int64 IDs, skipping k-mers with ambiguous bases.
+
+    The ID of a k-mer holds its bases two bits each, first base in the
+    highest bits, so IDs sort in the same order as the k-mer strings.
+
+    Args:
+        codes (np.array): uint8 base codes from encode_bases.
+        k (int): Length of k-mer, at most MAX_PACKED_K.
+
+    Returns:
+        np.array: Sorted distinct k-mer IDs.
+        np.array: Count of each k-mer ID.
+    """
+    if njit is not None:
+        kmer_ids = _rolling_kmer_ids(codes, k)
+    else:
+        kmer_ids = _shifted_kmer_ids(codes, k)
+    return np.unique(kmer_ids, return_counts=True)
+
+
+def decode_kmer(kmer_id, k):
+    """Convert a packed 2-bit k-mer ID back to its string form."""
+    bases = []
+    for _ in range(k):
+        kmer_id, code = divmod(kmer_id, 4)
+        bases.append("ACGT"[code])
+    return "".join(reversed(bases))
+
+
+def kmer_counter(kmer_ids, counts, k):
+    """
+    Convert counted k-mer IDs into a Counter keyed by k-mer string.
+
+    Args:
+        kmer_ids (np.array): Distinct k-mer IDs.
+        counts (np.array): Count of each k-mer ID.
+        k (int): Length of k-mer.
+
+    Returns:
+        Counter: A Counter object with k-mers and their frequencies.
+    """
+    return Counter({decode_kmer(kmer_id, k): count
+                    for kmer_id, count in zip(kmer_ids.tolist(), counts.tolist())})
+
+
+def count_kmers(sequence, k):
+    """
+    Count the k-mers of a sequence through their packed 2-bit IDs.
+
+    Only the distinct k-mers are converted back to strings.
+
+    Args:
+        sequence (str or bytes): DNA sequence.
+        k (int): Length of k-mer, at most MAX_PACKED_K.
+
+    Returns:
+        Counter: A Counter object with k-mers and their frequencies.
+    """
+    return kmer_counter(*count_kmer_ids(encode_bases(sequence), k), k)
+
+
+def count_long_kmers(sequence, k):
+    """
+    Count k-mers too long to pack into an int64 ID as strings.
+
+    Follows the same rules as the packed path: lowercase bases are counted
+    as uppercase and k-mers containing bases other than A/C/G/T are skipped.
+
+    Args:
+        sequence (str or bytes): DNA sequence.
+        k (int): Length of k-mer, greater than MAX_PACKED_K.
+
+    Returns:
+        Counter: A Counter object with k-mers and their frequencies.
+    """
+    seq_bytes = sequence.encode('ascii') if isinstance(sequence, str) else sequence
+    if len(seq_bytes) < k:
+        return Counter()
+
+    ambiguous_cumsum = np.concatenate(([0], np.cumsum(encode_bases(seq_bytes) == AMBIGUOUS)))
+    starts = np.flatnonzero(ambiguous_cumsum[k:] == ambiguous_cumsum[:-k])
+    upper = seq_bytes.upper().decode('ascii')
+    return Counter(upper[i:i + k] for i in starts.tolist())
+
+
+def _shifted_kmer_ids(codes, k):
+    """Build the IDs of all unambiguous k-mers with k vectorized shift/or steps."""
+    n_kmers = codes.size - k + 1
+    if n_kmers <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    ambiguous = codes == AMBIGUOUS
+    ambiguous_cumsum = np.concatenate(([0], np.cumsum(ambiguous)))
+    valid = ambiguous_cumsum[k:] == ambiguous_cumsum[:-k]
+
+    codes = np.where(ambiguous, 0, codes).astype(np.int64)
+    kmer_ids = np.zeros(n_kmers, dtype=np.int64)
+    for j in range(k):
+        kmer_ids <<= 2
+        kmer_ids |= codes[j:j + n_kmers]
+    return kmer_ids[valid]
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _rolling_kmer_ids(codes, k):
+        """Build the IDs of all unambiguous k-mers with one rolling pass."""
+        mask = (np.int64(1) << (2 * k)) - 1
+        kmer_ids = np.empty(max(codes.size - k + 1, 0), dtype=np.int64)
+        n_kmers = 0
+        kmer_id = np.int64(0)
+        run = 0
+        for code in codes:
+            if code == AMBIGUOUS:
+                run = 0
+                continue
+            kmer_id = ((kmer_id << 2) | code) & mask
+            run += 1
+            if run >= k:
+                kmer_ids[n_kmers] = kmer_id
+                n_kmers += 1
+        return kmer_ids[:n_kmers]
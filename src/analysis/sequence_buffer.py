@@ -0,0 +1,194 @@
+from collections.abc import Mapping
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional dependency, see the "fast" extra in setup.py
+    njit = None
+
+# Marks G/C (either case) as True and every other byte as False.
+_GC_MASK = np.zeros(256, dtype=bool)
+_GC_MASK[list(b"GCgc")] = True
+
+
+class SequenceView(Mapping):
+    """
+    Read-only mapping of sequence IDs to sequences backed by one packed buffer.
+
+    All bases live in a single contiguous uint8 array; sequence ``i`` spans
+    ``seq_buf[offsets[i]:offsets[i + 1]]``. Sequences are only decoded to
+    ``str`` when looked up by ID.
+    """
+
+    def __init__(self, ids, seq_buf, offsets):
+        """
+        Initialize the view.
+
+        Args:
+            ids (list): Sequence IDs in file order; must be unique.
+            seq_buf (np.array): Concatenated bases as uint8.
+            offsets (np.array): int64 start offsets, with the total length appended.
+
+        Raises:
+            ValueError: If an ID occurs more than once.
+        """
+        self.ids = ids
+        self.seq_buf = seq_buf
+        self.offsets = offsets
+        self._index = {seq_id: i for i, seq_id in enumerate(ids)}
+        if len(self._index) != len(ids):
+            raise ValueError("Sequence IDs must be unique; use drop_duplicate_ids first")
+
+    @classmethod
+    def from_dict(cls, sequences):
+        """
+        Pack a dictionary of sequences into a SequenceView.
+
+        Args:
+            sequences (dict): Dictionary of sequences.
+
+        Returns:
+            SequenceView: View over a newly packed buffer.
+        """
+        return cls(list(sequences), *pack_sequences(sequences.values()))
+
+    def __getitem__(self, seq_id):
+        i = self._index[seq_id]
+        return self.seq_buf[self.offsets[i]:self.offsets[i + 1]].tobytes().decode('ascii')
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+def pack_sequences(sequences):
+    """
+    Pack sequences into one contiguous uint8 buffer.
+
+    Args:
+        sequences (iterable): DNA sequences as str.
+
+    Returns:
+        np.array: Concatenated bases as uint8.
+        np.array: int64 start offsets, with the total length appended.
+    """
+    encoded = [seq.encode('ascii') for seq in sequences]
+    seq_buf = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    lengths = np.fromiter((len(seq) for seq in encoded), dtype=np.int64, count=len(encoded))
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    return seq_buf, offsets
+
+
+def drop_duplicate_ids(ids, seq_buf, offsets):
+    """
+    Keep one record per ID, with the same result as building a dict from the records.
+
+    Each ID keeps the position of its first occurrence and the sequence of
+    its last one.
+
+    Args:
+        ids (list): Sequence IDs in file order.
+        seq_buf (np.array): Concatenated bases as uint8.
+        offsets (np.array): int64 start offsets, with the total length appended.
+
+    Returns:
+        tuple: Unique sequence IDs, packed uint8 buffer and int64 offsets;
+            the inputs themselves if there were no duplicates.
+    """
+    last_index = {}
+    for i, seq_id in enumerate(ids):
+        last_index[seq_id] = i
+    if len(last_index) == len(ids):
+        return ids, seq_buf, offsets
+
+    keep = np.fromiter(last_index.values(), dtype=np.int64, count=len(last_index))
+    starts, ends = offsets[keep], offsets[keep + 1]
+    new_offsets = np.concatenate(([0], np.cumsum(ends - starts)))
+    new_buf = np.concatenate([seq_buf[start:end] for start, end in zip(starts, ends)] or [seq_buf[:0]])
+    return list(last_index), new_buf, new_offsets
+
+
+def as_sequence_view(sequences):
+    """
+    Return a mapping of sequences as a SequenceView, packing it if needed.
+
+    Args:
+        sequences (dict): Dictionary of sequences, or a SequenceView.
+
+    Returns:
+        SequenceView: The view itself, or a view over a newly packed buffer.
+    """
+    if isinstance(sequences, SequenceView):
+        return sequences
+    return SequenceView.from_dict(sequences)
+
+
+def get_gc_count(sequence):
+    """
+    Count the G/C bases (either case) of a single sequence.
+
+    Uses the C-level str/bytes count, which beats setting up an array for
+    one sequence; use get_gc_counts for packed batches.
+
+    Args:
+        sequence (str or bytes): DNA sequence.
+
+    Returns:
+        int: Number of G/C bases.
+    """
+    if isinstance(sequence, str):
+        return sequence.count('G') + sequence.count('C') + sequence.count('g') + sequence.count('c')
+    return sequence.count(b'G') + sequence.count(b'C') + sequence.count(b'g') + sequence.count(b'c')
+
+
+def get_gc_counts(seq_buf, offsets):
+    """
+    Count the G/C bases (either case) of every sequence in a packed buffer.
+
+    Uses a parallel Numba kernel when numba is installed, otherwise a single
+    vectorized NumPy pass.
+
+    Args:
+        seq_buf (np.array): Concatenated bases as uint8.
+        offsets (np.array): int64 start offsets, with the total length appended.
+
+    Returns:
+        np.array: int64 G/C count of each sequence.
+    """
+    if njit is not None:
+        return _gc_counts_numba(seq_buf, np.asarray(offsets, dtype=np.int64))
+
+    # Prefix sums (rather than np.add.reduceat) keep empty sequences correct.
+    gc_cumsum = np.concatenate(([0], np.cumsum(_GC_MASK[seq_buf], dtype=np.int64)))
+    return gc_cumsum[offsets[1:]] - gc_cumsum[offsets[:-1]]
+
+
+def get_gc_contents(seq_buf, offsets):
+    """
+    Calculate the GC content of every sequence in a packed buffer in one pass.
+
+    Args:
+        seq_buf (np.array): Concatenated bases as uint8.
+        offsets (np.array): int64 start offsets, with the total length appended.
+
+    Returns:
+        np.array: GC content percentage of each sequence.
+    """
+    return get_gc_counts(seq_buf, offsets) / np.diff(offsets) * 100.0
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _gc_counts_numba(seq_buf, offsets):
+        """Count G/C bases per sequence, one sequence per parallel iteration."""
+        gc_counts = np.zeros(offsets.size - 1, dtype=np.int64)
+        for i in prange(offsets.size - 1):
+            count = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                base = seq_buf[j]
+                if base == 71 or base == 67 or base == 103 or base == 99:  # G, C, g, c
+                    count += 1
+            gc_counts[i] = count
+        return gc_counts
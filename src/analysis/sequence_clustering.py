@@ -1,5 +1,7 @@
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.preprocessing import StandardScaler
+from src.analysis.sequence_buffer import as_sequence_view, get_gc_count, get_gc_contents
 from src.utils.logger import log_message
 
 
@@ -7,6 +9,9 @@ def cluster_sequences(sequences, n_clusters=3):
     """
     Cluster sequences based on GC content and sequence length.
 
+    Features are standardized before clustering so that sequence length does
+    not dwarf GC content; the unscaled features are returned for plotting.
+
     Args:
         sequences (dict): Dictionary of sequences.
         n_clusters (int): Number of clusters.
@@ -15,16 +20,39 @@ def cluster_sequences(sequences, n_clusters=3):
         dict: Dictionary with sequence IDs as keys and cluster labels as values.
         np.array: Array of features used for clustering.
     """
-    features = np.array([[_get_gc_content(seq), len(seq)] for seq in sequences.values()])
-    kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-    clusters = kmeans.fit_predict(features)
+    gc_contents, lengths = _get_gc_contents(sequences)
+    # Filled column by column so no float64 (N, 2) temporary is allocated.
+    features = np.empty((len(lengths), 2), dtype=np.float32)
+    features[:, 0] = gc_contents
+    features[:, 1] = lengths
+    # The scaler's copy is the only one made: features is returned unscaled.
+    scaled_features = StandardScaler().fit_transform(features)
+    kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42, batch_size=4096, n_init=3)
+    clusters = kmeans.fit_predict(scaled_features)
 
     result = dict(zip(sequences.keys(), clusters))
     log_message(f"Clustered {len(sequences)} sequences into {n_clusters} clusters")
     return result, features
 
 
+def _get_gc_contents(sequences):
+    """
+    Calculate the GC content and length of every sequence in a single vectorized pass.
+
+    A SequenceView is used in place; other mappings are packed into one
+    first, so the whole batch is scanned as a single contiguous buffer.
+
+    Args:
+        sequences (dict): Dictionary of sequences.
+
+    Returns:
+        np.array: GC content percentage of each sequence.
+        np.array: Length of each sequence.
+    """
+    batch = as_sequence_view(sequences)
+    return get_gc_contents(batch.seq_buf, batch.offsets), np.diff(batch.offsets)
+
+
 def _get_gc_content(sequence):
     """Helper function to calculate GC content."""
-    gc_count = sequence.count('G') + sequence.count('C')
-    return gc_count / len(sequence) * 100
+    return get_gc_count(sequence) / len(sequence) * 100
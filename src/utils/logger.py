@@ -6,6 +6,6 @@ def setup_logging():
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
-def log_message(message):
-    """Log an info message."""
-    logging.info(message)
+def log_message(message, *args):
+    """Log an info message; %-style args are only formatted if INFO is enabled."""
+    logging.info(message, *args)
@@ -2,6 +2,6 @@
 This module contains visualization functions for the results.
 """
 
-from .plots import plot_gc_content, plot_sequence_clusters, plot_kmer_frequency
+from .plots import plot_gc_content, plot_sequence_clusters, plot_kmer_frequency, plot_kmer_frequency_batch, close
 
-__all__ = ['plot_gc_content', 'plot_sequence_clusters', 'plot_kmer_frequency']
+__all__ = ['plot_gc_content', 'plot_sequence_clusters', 'plot_kmer_frequency', 'plot_kmer_frequency_batch', 'close']
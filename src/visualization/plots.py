@@ -1,25 +1,85 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
+import math
+from matplotlib.figure import Figure
+from src.analysis.sequence_buffer import as_sequence_view, get_gc_contents
 from src.utils.logger import log_message
 
+# Figure shared by all plots, so repeated calls reuse one figure instead of
+# creating a new one. It is not registered with pyplot, so it never becomes
+# pyplot's current figure and never receives a caller's plt.* calls.
+_figure = None
 
-def plot_gc_content(sequences, gc_contents):
+
+def _get_figure(figsize):
+    """
+    Return the shared figure, cleared and resized.
+
+    Args:
+        figsize (tuple): Figure size in inches.
+
+    Returns:
+        Figure: The shared figure.
+    """
+    global _figure
+    if _figure is None:
+        _figure = Figure(figsize=figsize)
+    else:
+        _figure.clf()
+        _figure.set_size_inches(figsize)
+    return _figure
+
+
+def close():
+    """Release the shared figure; the next plot creates a new one."""
+    global _figure
+    if _figure is not None:
+        _figure.clf()
+        _figure = None
+
+
+def _get_axes(figsize):
+    """
+    Return the shared figure with one fresh Axes filling it.
+
+    Args:
+        figsize (tuple): Figure size in inches.
+
+    Returns:
+        Figure: The shared figure.
+        Axes: A new Axes filling the figure.
+    """
+    fig = _get_figure(figsize)
+    return fig, fig.add_subplot()
+
+
+def _bar(ax, labels, values):
+    """Draw a bar plot with one labelled bar per value."""
+    positions = range(len(values))
+    ax.bar(positions, values)
+    ax.set_xticks(positions)
+    ax.set_xticklabels(labels)
+
+
+def plot_gc_content(sequences, gc_contents=None):
     """
     Create a bar plot of GC content for each sequence.
 
     Args:
         sequences (dict): Dictionary of sequences.
-        gc_contents (list): List of GC content values.
+        gc_contents (list): List of GC content values; computed from the
+            sequences in one vectorized pass if not given.
     """
-    plt.figure(figsize=(12, 6))
-    sns.barplot(x=list(sequences.keys()), y=gc_contents)
-    plt.title('GC Content in Sequences')
-    plt.xlabel('Sequence ID')
-    plt.ylabel('GC Content (%)')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    plt.savefig('gc_content.png')
-    plt.close()
+    if gc_contents is None:
+        batch = as_sequence_view(sequences)
+        gc_contents = get_gc_contents(batch.seq_buf, batch.offsets)
+
+    fig, ax = _get_axes((12, 6))
+    _bar(ax, list(sequences.keys()), gc_contents)
+    ax.set_title('GC Content in Sequences')
+    ax.set_xlabel('Sequence ID')
+    ax.set_ylabel('GC Content (%)')
+    ax.tick_params(axis='x', rotation=90)
+    fig.tight_layout()
+    fig.savefig('gc_content.png')
     log_message("Created GC content plot: gc_content.png")
 
 
@@ -27,18 +87,19 @@ def plot_sequence_clusters(features, clusters):
     """
     Create a scatter plot of sequence clusters.
 
+    Points are rasterized so large inputs are not saved as one vector marker each.
+
     Args:
         features (np.array): Array of features used for clustering.
         clusters (np.array): Array of cluster labels.
     """
-    plt.figure(figsize=(10, 6))
-    scatter = plt.scatter(features[:, 0], features[:, 1], c=clusters, cmap='viridis')
-    plt.colorbar(scatter)
-    plt.title('Sequence Clusters')
-    plt.xlabel('GC Content (%)')
-    plt.ylabel('Sequence Length')
-    plt.savefig('sequence_clusters.png')
-    plt.close()
+    fig, ax = _get_axes((10, 6))
+    scatter = ax.scatter(features[:, 0], features[:, 1], c=clusters, cmap='viridis', rasterized=True)
+    fig.colorbar(scatter, ax=ax)
+    ax.set_title('Sequence Clusters')
+    ax.set_xlabel('GC Content (%)')
+    ax.set_ylabel('Sequence Length')
+    fig.savefig('sequence_clusters.png')
     log_message("Created sequence clusters plot: sequence_clusters.png")
 
 
@@ -53,13 +114,47 @@ def plot_kmer_frequency(kmer_freq, top_n=10):
     top_kmers = kmer_freq.most_common(top_n)
     kmers, freqs = zip(*top_kmers)
 
-    plt.figure(figsize=(12, 6))
-    sns.barplot(x=list(kmers), y=list(freqs))
-    plt.title(f'Top {top_n} Most Common k-mers')
-    plt.xlabel('k-mer')
-    plt.ylabel('Frequency')
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig('kmer_frequency.png')
-    plt.close()
-    log_message(f"Created k-mer frequency plot: kmer_frequency.png")
+    fig, ax = _get_axes((12, 6))
+    _bar(ax, kmers, freqs)
+    ax.set_title(f'Top {top_n} Most Common k-mers')
+    ax.set_xlabel('k-mer')
+    ax.set_ylabel('Frequency')
+    ax.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+    fig.savefig('kmer_frequency.png')
+    log_message("Created k-mer frequency plot: kmer_frequency.png")
+
+
+def plot_kmer_frequency_batch(kmer_freqs, top_n=10, n_cols=4):
+    """
+    Create one figure with a bar plot of top k-mer frequencies per sequence.
+
+    Args:
+        kmer_freqs (dict): Dictionary with sequence IDs as keys and k-mer frequency Counters as values.
+        top_n (int): Number of top k-mers to plot per sequence.
+        n_cols (int): Number of subplot columns.
+    """
+    if not kmer_freqs:
+        log_message("No k-mer frequencies to plot")
+        return
+
+    n_cols = min(n_cols, len(kmer_freqs))
+    n_rows = math.ceil(len(kmer_freqs) / n_cols)
+    fig = _get_figure((4 * n_cols, 3 * n_rows))
+    axes = fig.subplots(n_rows, n_cols, squeeze=False)
+    for ax, (seq_id, kmer_freq) in zip(axes.flat, kmer_freqs.items()):
+        top_kmers = kmer_freq.most_common(top_n)
+        if top_kmers:
+            kmers, freqs = zip(*top_kmers)
+            _bar(ax, kmers, freqs)
+        ax.set_title(seq_id)
+        ax.set_xlabel('k-mer')
+        ax.set_ylabel('Frequency')
+        ax.tick_params(axis='x', rotation=45)
+    for ax in axes.flat[len(kmer_freqs):]:
+        ax.axis('off')
+
+    fig.suptitle(f'Top {top_n} Most Common k-mers')
+    fig.tight_layout()
+    fig.savefig('kmer_frequency.png')
+    log_message("Created k-mer frequency plot for %d sequences: kmer_frequency.png", len(kmer_freqs))
@@ -1,24 +1,136 @@
+import gzip
+import os
+import shutil
+import tempfile
 import unittest
+from unittest.mock import patch
+from src.analysis import dna_analyzer
 from src.analysis.dna_analyzer import DNAAnalyzer
 
 
 class TestDNAAnalyzer(unittest.TestCase):
     def setUp(self):
-        self.analyzer = DNAAnalyzer("data/sequences.fasta")
+        self.analyzer = DNAAnalyzer("data/sequences.fasta", use_cache=False)
+
+    def test_read_fasta(self):
+        self.assertEqual(len(self.analyzer.sequences), 5)
+        self.assertEqual(self.analyzer.sequences["Sequence1"], "ATGC" * 11)
+
+    def _check_read_fasta_edge_cases(self):
+        fasta = b"ignored\n>seq1 description\nACgt\r\nNN\n>seq2\n>seq3\nAC"
+        expected_sequences = {"seq1": "ACgtNN", "seq2": "", "seq3": "AC"}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fasta_path = os.path.join(tmp_dir, "sequences.fasta")
+            with open(fasta_path, "wb") as fh:
+                fh.write(fasta)
+            with gzip.open(fasta_path + ".gz", "wb") as fh:
+                fh.write(fasta)
+
+            for path in (fasta_path, fasta_path + ".gz"):
+                analyzer = DNAAnalyzer(path, use_cache=False)
+                self.assertEqual(dict(analyzer.sequences), expected_sequences)
+
+            leading_newline_path = os.path.join(tmp_dir, "leading_newline.fasta")
+            with open(leading_newline_path, "wb") as fh:
+                fh.write(b"\n>s1\nACGT\n>s2\nGG\n")
+            analyzer = DNAAnalyzer(leading_newline_path, use_cache=False)
+            self.assertEqual(dict(analyzer.sequences), {"s1": "ACGT", "s2": "GG"})
+
+            duplicate_path = os.path.join(tmp_dir, "duplicate.fasta")
+            with open(duplicate_path, "wb") as fh:
+                fh.write(b">x\nAC\n>y\nT\n>x\nGG\n")
+            analyzer = DNAAnalyzer(duplicate_path, use_cache=False)
+            self.assertEqual(list(analyzer.sequences.items()), [("x", "GG"), ("y", "T")])
+
+            empty_path = os.path.join(tmp_dir, "empty.fasta")
+            open(empty_path, "wb").close()
+            self.assertEqual(len(DNAAnalyzer(empty_path, use_cache=False).sequences), 0)
+
+    @patch('src.analysis.dna_analyzer.pyfastx', None)
+    def test_read_fasta_without_pyfastx(self):
+        self._check_read_fasta_edge_cases()
+
+    @unittest.skipIf(dna_analyzer.pyfastx is None, "pyfastx is not installed")
+    def test_read_fasta_with_pyfastx(self):
+        self._check_read_fasta_edge_cases()
+
+    def test_fasta_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fasta_path = os.path.join(tmp_dir, "sequences.fasta")
+            shutil.copy("data/sequences.fasta", fasta_path)
+
+            parsed = DNAAnalyzer(fasta_path)
+            self.assertTrue(os.path.exists(fasta_path + ".gi.npz"))
+            cached = DNAAnalyzer(fasta_path)
+            self.assertEqual(dict(cached.sequences), dict(parsed.sequences))
+
+            # A replacement with an older mtime (as left by cp -p or untar) must not hit the cache.
+            stat = os.stat(fasta_path)
+            with open(fasta_path, "w") as fh:
+                fh.write(">other\nGGCC\n")
+            os.utime(fasta_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10 ** 9))
+            replaced = DNAAnalyzer(fasta_path)
+            self.assertEqual(dict(replaced.sequences), {"other": "GGCC"})
+
+    def test_gc_contents(self):
+        expected_gc_contents = [self.analyzer.get_gc_content(seq) for seq in self.analyzer.sequences.values()]
+        self.assertEqual(list(self.analyzer.get_gc_contents()), expected_gc_contents)
 
     def test_gc_content(self):
         sequence = "ATGC"
         expected_gc_content = 50.0
         self.assertAlmostEqual(self.analyzer.get_gc_content(sequence), expected_gc_content)
 
+    def test_empty_sequence(self):
+        with self.assertRaises(ValueError):
+            self.analyzer.get_gc_content("")
+        with self.assertRaises(ValueError):
+            self.analyzer.analyze_sequence("", ["ATAGC"])
+
     def test_find_motifs(self):
         sequence = "ATAGCATAGC"
         motif = "ATAGC"
         expected_positions = [0, 5]
         self.assertEqual(self.analyzer.find_motifs(sequence, motif), expected_positions)
 
+    def test_find_motifs_batch(self):
+        sequence = "ATAGCATAGC"
+        expected_positions = {"ATAGC": [0, 5], "AGC": [2, 7], "GGG": []}
+        self.assertEqual(self.analyzer.find_motifs_batch(sequence, ["ATAGC", "AGC", "GGG"]), expected_positions)
+
+    def test_find_motifs_batch_backends_agree(self):
+        expected_positions = {"AC": [0, 2], "": [0, 1, 2, 3, 4]}
+        for sequence in ("ACAC", b"ACAC"):
+            self.assertEqual(self.analyzer.find_motifs_batch(sequence, ["AC", ""]), expected_positions)
+            with patch('src.analysis.dna_analyzer.ahocorasick', None):
+                self.assertEqual(self.analyzer.find_motifs_batch(sequence, ["AC", ""]), expected_positions)
+
+    def test_find_motifs_parallel(self):
+        sequence = "ATAGC" * 50 + "AAAA"
+        expected_positions = self.analyzer.find_motifs(sequence, "GCATA")
+        self.assertEqual(self.analyzer.find_motifs_parallel(sequence, "GCATA", chunk_size=7), expected_positions)
+        self.assertEqual(self.analyzer.find_motifs_parallel(sequence, "AA", chunk_size=3), [250, 251, 252])
+
+    def test_analyze_sequence(self):
+        sequence = "ATAGCATAGC"
+        gc_content, motif_positions, kmer_freq = self.analyzer.analyze_sequence(sequence, ["ATAGC"], k=3)
+        self.assertAlmostEqual(gc_content, self.analyzer.get_gc_content(sequence))
+        self.assertEqual(motif_positions, {"ATAGC": [0, 5]})
+        self.assertEqual(kmer_freq, self.analyzer.get_kmer_frequency(sequence, k=3))
+
     def test_kmer_frequency(self):
         sequence = "ATGATG"
+        expected_frequency = {"ATG": 2, "TGA": 1, "GAT": 1}
+        self.assertEqual(dict(self.analyzer.get_kmer_frequency(sequence, k=3)), expected_frequency)
+
+    def test_kmer_frequencies(self):
+        sequence = "ATGATG"
+        frequencies = self.analyzer.get_kmer_frequencies(sequence, [1, 3])
+        self.assertEqual(dict(frequencies[1]), {"A": 2, "T": 2, "G": 2})
+        self.assertEqual(dict(frequencies[3]), {"ATG": 2, "TGA": 1, "GAT": 1})
+
+    def test_kmer_frequency_skips_ambiguous_bases(self):
+        sequence = "ATGNATgA"
         expected_frequency = {"ATG": 2, "TGA": 1}
         self.assertEqual(dict(self.analyzer.get_kmer_frequency(sequence, k=3)), expected_frequency)
 
@@ -0,0 +1,32 @@
+import unittest
+from collections import Counter
+from src.analysis.kmer_counts import count_kmers, count_kmer_ids, count_long_kmers, decode_kmer, encode_bases
+
+
+class TestKmerCounts(unittest.TestCase):
+
+    def test_count_kmers(self):
+        sequence = "ATCGATCGAT"
+        expected = Counter(sequence[i:i + 3] for i in range(len(sequence) - 2))
+        self.assertEqual(count_kmers(sequence, 3), expected)
+
+    def test_count_kmers_skips_ambiguous(self):
+        self.assertEqual(count_kmers("ACNGTacg", 2), Counter({'AC': 2, 'GT': 1, 'TA': 1, 'CG': 1}))
+
+    def test_count_kmer_ids_sorted(self):
+        kmer_ids, counts = count_kmer_ids(encode_bases("TTAA"), 2)
+        self.assertEqual([decode_kmer(kmer_id, 2) for kmer_id in kmer_ids], ['AA', 'TA', 'TT'])
+        self.assertEqual(list(counts), [1, 1, 1])
+
+    def test_count_long_kmers_matches_packed_rules(self):
+        self.assertEqual(count_long_kmers("acgtN" * 10, 32), Counter())
+        sequence = "ACGTTGCA" * 5
+        expected = Counter(sequence[i:i + 32] for i in range(len(sequence) - 31))
+        self.assertEqual(count_long_kmers(sequence.lower(), 32), expected)
+
+    def test_short_sequence(self):
+        self.assertEqual(count_kmers("AC", 3), Counter())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,32 +1,69 @@
 import unittest
 from unittest.mock import patch
-from src.visualization.plots import plot_gc_content, plot_sequence_clusters, plot_kmer_frequency
+from src.visualization import plots
+from src.visualization.plots import plot_gc_content, plot_sequence_clusters, plot_kmer_frequency, plot_kmer_frequency_batch
 from collections import Counter
+import matplotlib.pyplot as plt
 import numpy as np
 
 
 class TestPlots(unittest.TestCase):
 
-    @patch('matplotlib.pyplot.savefig')
+    @patch('matplotlib.figure.Figure.savefig')
     def test_plot_gc_content(self, mock_savefig):
         sequences = {"seq1": "ATCG", "seq2": "GGCC"}
         gc_contents = [50.0, 100.0]
         plot_gc_content(sequences, gc_contents)
         mock_savefig.assert_called_once_with('gc_content.png')
 
-    @patch('matplotlib.pyplot.savefig')
+    @patch('src.visualization.plots._bar')
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_plot_gc_content_computes_gc_contents(self, mock_savefig, mock_bar):
+        sequences = {"seq1": "ATCG", "seq2": "GGCC"}
+        plot_gc_content(sequences)
+        self.assertEqual(list(mock_bar.call_args[0][2]), [50.0, 100.0])
+        mock_savefig.assert_called_once_with('gc_content.png')
+
+    @patch('matplotlib.figure.Figure.savefig')
     def test_plot_sequence_clusters(self, mock_savefig):
         features = np.array([[50.0, 100], [75.0, 200]])
         clusters = np.array([0, 1])
         plot_sequence_clusters(features, clusters)
         mock_savefig.assert_called_once_with('sequence_clusters.png')
 
-    @patch('matplotlib.pyplot.savefig')
+    @patch('matplotlib.figure.Figure.savefig')
     def test_plot_kmer_frequency(self, mock_savefig):
         kmer_freq = Counter({'ATG': 3, 'CGT': 2, 'TTA': 1})
         plot_kmer_frequency(kmer_freq)
         mock_savefig.assert_called_once_with('kmer_frequency.png')
 
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_plot_kmer_frequency_batch(self, mock_savefig):
+        kmer_freqs = {
+            "seq1": Counter({'ATG': 3, 'CGT': 2, 'TTA': 1}),
+            "seq2": Counter({'GGC': 4, 'ATG': 1}),
+            "seq3": Counter(),
+        }
+        plot_kmer_frequency_batch(kmer_freqs, n_cols=2)
+        mock_savefig.assert_called_once_with('kmer_frequency.png')
+
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_plots_reuse_figure(self, mock_savefig):
+        plot_gc_content({"seq1": "ATCG"}, [50.0])
+        figure = plots._figure
+        plot_kmer_frequency_batch({"seq1": Counter({'ATG': 3}), "seq2": Counter({'GGC': 1})})
+        self.assertIs(plots._figure, figure)
+        self.assertEqual(len(figure.axes), 2)
+
+        plots.close()
+        plot_kmer_frequency(Counter({'ATG': 3}))
+        self.assertIsNot(plots._figure, figure)
+
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_plots_leave_pyplot_alone(self, mock_savefig):
+        plt.close('all')
+        plot_gc_content({"seq1": "ATCG"}, [50.0])
+        self.assertEqual(plt.get_fignums(), [])
 
 if __name__ == '__main__':
     unittest.main()
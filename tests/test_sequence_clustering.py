@@ -1,12 +1,14 @@
 import unittest
-from src.analysis.sequence_clustering import cluster_sequences, _get_gc_content
+from src.analysis.sequence_buffer import SequenceView
+from src.analysis.sequence_clustering import cluster_sequences, _get_gc_content, _get_gc_contents
 
 
 class TestSequenceClustering(unittest.TestCase):
 
     def test_cluster_sequences(self):
+        # seq1 (25% GC) is nearer seq3 (0%) than seq2 (100%), so the split is unambiguous.
         sequences = {
-            "seq1": "ATCG",
+            "seq1": "ATCA",
             "seq2": "GGCC",
             "seq3": "AATT"
         }
@@ -19,11 +21,33 @@ class TestSequenceClustering(unittest.TestCase):
         self.assertEqual(clusters["seq1"], clusters["seq3"])
         self.assertNotEqual(clusters["seq1"], clusters["seq2"])
 
+    def test_cluster_sequences_uses_length(self):
+        sequences = {"a": "GGGG", "b": "G" * 32, "c": "G" * 42}
+        clusters, features = cluster_sequences(sequences, n_clusters=2)
+
+        self.assertEqual(len(set(clusters.values())), 2)
+        self.assertEqual(clusters["b"], clusters["c"])
+        self.assertNotEqual(clusters["a"], clusters["b"])
+
+    def test_cluster_sequence_view(self):
+        sequences = {"seq1": "ATCG", "seq2": "GGCC", "seq3": "AATT"}
+        clusters, features = cluster_sequences(SequenceView.from_dict(sequences), n_clusters=2)
+        expected_clusters, expected_features = cluster_sequences(sequences, n_clusters=2)
+
+        self.assertEqual(clusters, expected_clusters)
+        self.assertEqual(features.tolist(), expected_features.tolist())
+
     def test_get_gc_content(self):
         self.assertEqual(_get_gc_content("ATCG"), 50.0)
         self.assertEqual(_get_gc_content("GGCC"), 100.0)
         self.assertEqual(_get_gc_content("AATT"), 0.0)
 
+    def test_get_gc_contents(self):
+        sequences = {"seq1": "ATCG", "seq2": "GGCC", "seq3": "AATT", "seq4": "GCGCA"}
+        gc_contents, lengths = _get_gc_contents(sequences)
+        self.assertEqual(list(gc_contents), [50.0, 100.0, 0.0, 80.0])
+        self.assertEqual(list(lengths), [4, 4, 4, 5])
+
 
 if __name__ == '__main__':
     unittest.main()